@@ -1,16 +1,24 @@
 from dotenv import load_dotenv
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 load_dotenv(override=True)
-from src.errors import generic_exception_handler, rgb_lib_exception_handler
-from src.wallet_utils import WalletNotFoundError
-from fastapi import FastAPI,Request
+from src.errors import generic_exception_handler, rgb_lib_exception_handler, wallet_not_found_exception_handler
+from src.wallet_utils import WalletNotFoundError, NETWORK, INDEXER_URL
+from fastapi import FastAPI
 from src.routes import router 
+from src.queue import init_database, recover_active_watchers_concurrently
+from src.database import close_connection_pool
+from contextlib import asynccontextmanager
 import rgb_lib
+from anyio import to_thread
+import asyncio
 import os
 import logging
 
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+ENABLE_RECOVERY = os.getenv("ENABLE_RECOVERY", "true").lower() == "true"
+# Sync routes (every rgb_lib call) run in anyio's worker threads; this caps how many run at once
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "40"))
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL, logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -19,37 +27,40 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="ThunderLink RGB Wallet API",
-    version="1.0.0",
-    description="API documentation for RGB wallet management and asset transfers")
-app.add_exception_handler(rgb_lib.RgbLibError, rgb_lib_exception_handler)
-app.add_exception_handler(Exception, generic_exception_handler)
-@app.exception_handler(WalletNotFoundError)
-async def wallet_not_found_handler(request: Request, exc: WalletNotFoundError):
-    return JSONResponse(
-        status_code=404,
-        content={"error": str(exc)}
-    )
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database and recover active watchers on startup."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize database and recover active watchers on startup, close the pool on shutdown."""
+    to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+    logger.info(f"API threadpool size: {API_THREADPOOL_SIZE}")
+    logger.info(f"Network: {NETWORK}, indexer: {INDEXER_URL}, proxy: {os.getenv('PROXY_ENDPOINT')}")
+    
     try:
-        from src.queue import init_database, recover_active_watchers
-        
         # Initialize database schema
         logger.info("Initializing database schema...")
-        init_database()
+        await asyncio.to_thread(init_database)
         logger.info("Database schema initialized")
         
-        if os.getenv("ENABLE_RECOVERY", "true").lower() == "true":
+        if ENABLE_RECOVERY:
             logger.info("Recovering active watchers...")
-            recovered = recover_active_watchers()
+            recovered = await recover_active_watchers_concurrently()
             logger.info(f"Recovery complete: {recovered} watchers recovered")
         else:
             logger.info("Recovery disabled (ENABLE_RECOVERY=false)")
     except Exception as e:
         logger.error(f"Startup error: {e}", exc_info=True)
-      
+    
+    yield
+    
+    close_connection_pool()
+
+
+app = FastAPI(title="ThunderLink RGB Wallet API",
+    version="1.0.0",
+    description="API documentation for RGB wallet management and asset transfers",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse)
+app.add_exception_handler(rgb_lib.RgbLibError, rgb_lib_exception_handler)
+app.add_exception_handler(WalletNotFoundError, wallet_not_found_exception_handler)
+app.add_exception_handler(Exception, generic_exception_handler)
 
 app.include_router(router)
\ No newline at end of file
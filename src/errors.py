@@ -2,6 +2,7 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 import rgb_lib
 import logging
+from src.wallet_utils import WalletNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -43,3 +44,8 @@ async def generic_exception_handler(request: Request, exc: Exception):
         },
     )
 
+async def wallet_not_found_exception_handler(request: Request, exc: WalletNotFoundError):
+    return JSONResponse(
+        status_code=404,
+        content={"error": str(exc)}
+    )
@@ -20,6 +20,7 @@ from src.queue.watchers import (
     stop_watcher,
     get_active_watchers,
     get_active_watchers_for_wallet,
+    get_watcher_recipient_ids,
 )
 from src.queue.locks import (
     acquire_wallet_lock,
@@ -27,6 +28,7 @@ from src.queue.locks import (
 )
 from src.queue.recovery import (
     recover_active_watchers,
+    recover_active_watchers_concurrently,
 )
 from src.queue.schema import (
     init_database,
@@ -49,11 +51,13 @@ __all__ = [
     'stop_watcher',
     'get_active_watchers',
     'get_active_watchers_for_wallet',
+    'get_watcher_recipient_ids',
     # Locks
     'acquire_wallet_lock',
     'release_wallet_lock',
     # Recovery
     'recover_active_watchers',
+    'recover_active_watchers_concurrently',
     # Schema
     'init_database',
 ]
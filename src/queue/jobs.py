@@ -5,7 +5,7 @@ Handles job creation, dequeuing, status updates, and querying.
 """
 import os
 import time
-import uuid
+import secrets
 import logging
 from typing import Optional, Dict, Any, List
 from psycopg2.extras import RealDictCursor
@@ -30,6 +30,7 @@ def enqueue_refresh_job(
     
     Only manages jobs - does NOT create watchers.
     Each job gets a unique UUID, allowing multiple jobs per wallet.
+    An identical job that is still pending is reused instead of queueing a duplicate.
     For invoice_created jobs, recipient_id and asset_id can be provided.
     
     Args:
@@ -41,17 +42,36 @@ def enqueue_refresh_job(
         asset_id: Optional asset ID (for invoice_created jobs, can be None)
     
     Returns:
-        job_id: Unique job identifier (UUID)
+        job_id: Unique job identifier (UUID), or the id of the matching pending job
         
     Raises:
         psycopg2.Error: If database operation fails
     """
-    # Generate unique UUID for each job
-    job_id = str(uuid.uuid4())
+    # 16 random bytes as hex; the UUID column normalizes it and RETURNING
+    # hands back the canonical dashed form.
+    job_id = secrets.token_hex(16)
     
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
+                # Serialize enqueues per wallet for this transaction so concurrent
+                # duplicate requests see each other's pending job
+                cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (xpub_van,))
+                cur.execute("""
+                    SELECT job_id FROM refresh_jobs
+                    WHERE xpub_van = %s
+                    AND status = 'pending'
+                    AND trigger = %s
+                    AND recipient_id IS NOT DISTINCT FROM %s
+                    AND asset_id IS NOT DISTINCT FROM %s
+                    LIMIT 1
+                """, (xpub_van, trigger, recipient_id, asset_id))
+                
+                existing = cur.fetchone()
+                if existing:
+                    logger.debug(f"Reusing pending refresh job {existing[0]} for {xpub_van}")
+                    return existing[0]
+                
                 # Insert new job (each job has unique ID)
                 cur.execute("""
                     INSERT INTO refresh_jobs (
@@ -213,13 +233,7 @@ def get_pending_jobs_for_wallet(xpub_van: str) -> List[Dict[str, Any]]:
                     ORDER BY created_at ASC
                 """, (xpub_van,))
                 
-                jobs = []
-                for row in cur.fetchall():
-                    job = dict(row)
-                    _normalize_timestamps(job)
-                    jobs.append(job)
-                
-                return jobs
+                return [_job_from_row(row) for row in cur.fetchall()]
     except Exception as e:
         logger.error(f"Failed to get pending jobs for wallet: {e}")
         return []
@@ -271,6 +285,13 @@ def dequeue_job_for_wallet(xpub_van: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _job_from_row(row) -> Dict[str, Any]:
+    """Convert a RealDictCursor row into a job dictionary with Unix timestamps."""
+    job = dict(row)
+    _normalize_timestamps(job)
+    return job
+
+
 def _normalize_timestamps(data: Dict[str, Any]) -> None:
     """
     Normalize PostgreSQL timestamps to Unix timestamps (integers).
@@ -39,10 +39,10 @@ def acquire_wallet_lock(xpub_van: str, ttl: int = 30) -> bool:
                 cur.execute("SELECT cleanup_expired_locks()")
                 
                 # Try to insert lock
-                expires_at = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(time.time() + ttl))
+                expires_at = int(time.time()) + ttl
                 cur.execute("""
                     INSERT INTO wallet_locks (xpub_van, expires_at)
-                    VALUES (%s, %s)
+                    VALUES (%s, to_timestamp(%s) AT TIME ZONE 'UTC')
                     ON CONFLICT (xpub_van) DO NOTHING
                     RETURNING xpub_van
                 """, (xpub_van, expires_at))
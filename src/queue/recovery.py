@@ -3,12 +3,48 @@ Recovery operations.
 
 Handles recovery of active watchers after application restart.
 """
+import os
+import asyncio
 import logging
+from typing import Dict, Any
 from src.queue.jobs import enqueue_refresh_job
 from src.queue.watchers import get_active_watchers
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of watchers re-enqueued in parallel (kept below the connection pool size)
+RECOVERY_CONCURRENCY = int(os.getenv("RECOVERY_CONCURRENCY", "4"))
+
+
+def _recover_watcher(watcher: Dict[str, Any]) -> bool:
+    """
+    Re-enqueue the refresh job for a single active watcher.
+    
+    Args:
+        watcher: Active watcher dictionary
+        
+    Returns:
+        True if the watcher was recovered, False otherwise
+    """
+    try:
+        logger.info(
+            f"Recovering watcher for {watcher['xpub_van']}:{watcher['recipient_id']}"
+        )
+        
+        # Re-enqueue wallet job (watchers will be recreated when wallet is processed)
+        enqueue_refresh_job(
+            xpub_van=watcher['xpub_van'],
+            xpub_col=watcher['xpub_col'],
+            master_fingerprint=watcher['master_fingerprint'],
+            trigger='recovery'
+        )
+        return True
+    except Exception as e:
+        logger.error(
+            f"Failed to recover watcher {watcher.get('recipient_id')}: {e}"
+        )
+        return False
+
 
 def recover_active_watchers() -> int:
     """
@@ -26,26 +62,7 @@ def recover_active_watchers() -> int:
     """
     try:
         active_watchers = get_active_watchers()
-        recovered = 0
-        
-        for watcher in active_watchers:
-            try:
-                logger.info(
-                    f"Recovering watcher for {watcher['xpub_van']}:{watcher['recipient_id']}"
-                )
-                
-                # Re-enqueue wallet job (watchers will be recreated when wallet is processed)
-                enqueue_refresh_job(
-                    xpub_van=watcher['xpub_van'],
-                    xpub_col=watcher['xpub_col'],
-                    master_fingerprint=watcher['master_fingerprint'],
-                    trigger='recovery'
-                )
-                recovered += 1
-            except Exception as e:
-                logger.error(
-                    f"Failed to recover watcher {watcher.get('recipient_id')}: {e}"
-                )
+        recovered = sum(1 for watcher in active_watchers if _recover_watcher(watcher))
         
         logger.info(f"Recovered {recovered} active watchers")
         return recovered
@@ -53,3 +70,43 @@ def recover_active_watchers() -> int:
         logger.error(f"Failed to recover active watchers: {e}")
         return 0
 
+
+async def recover_active_watchers_concurrently(concurrency: int = RECOVERY_CONCURRENCY) -> int:
+    """
+    Recover active watchers without blocking the event loop.
+    
+    Loads active watchers in a worker thread, then re-enqueues their
+    refresh jobs in parallel (bounded by `concurrency` so the connection
+    pool is never exhausted). A failing watcher does not abort recovery.
+    
+    Args:
+        concurrency: Maximum number of watchers recovered in parallel
+        
+    Returns:
+        Number of watchers successfully recovered
+        
+    Example:
+        recovered = await recover_active_watchers_concurrently()
+    """
+    try:
+        active_watchers = await asyncio.to_thread(get_active_watchers)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def _recover(watcher: Dict[str, Any]) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(_recover_watcher, watcher)
+        
+        results = await asyncio.gather(
+            *(_recover(watcher) for watcher in active_watchers),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Watcher recovery task failed: {result}")
+        recovered = sum(1 for result in results if result is True)
+        
+        logger.info(f"Recovered {recovered} active watchers")
+        return recovered
+    except Exception as e:
+        logger.error(f"Failed to recover active watchers: {e}")
+        return 0
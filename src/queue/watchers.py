@@ -6,13 +6,16 @@ Handles watcher creation, status updates, and querying.
 import os
 import time
 import logging
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from datetime import timezone
+from typing import Optional, Dict, Any, List, Set
 from psycopg2.extras import RealDictCursor
 from src.database.connection import get_db_connection
 
 logger = logging.getLogger(__name__)
 
+# Configuration
+WATCHER_TTL = int(os.getenv("WATCHER_TTL", "86400"))
+
 
 def create_watcher(
     xpub_van: str,
@@ -38,24 +41,21 @@ def create_watcher(
         if expiration_seconds is not None:
             expires_at = current_time + expiration_seconds
         else:
-            default_ttl = int(os.getenv("WATCHER_TTL", "86400"))
-            expires_at = current_time + default_ttl
-        # Store as UTC datetime to avoid timezone issues
-        expires_at_dt = datetime.fromtimestamp(expires_at, tz=timezone.utc)
-        expires_at_str = expires_at_dt.strftime('%Y-%m-%d %H:%M:%S')
+            expires_at = current_time + WATCHER_TTL
         
         with get_db_connection() as conn:
             with conn.cursor() as cur:
+                # expires_at is passed as a Unix timestamp and stored as naive UTC
                 cur.execute("""
                     INSERT INTO refresh_watchers (
                         xpub_van, xpub_col, master_fingerprint, recipient_id, 
                         asset_id,
                         status, created_at, expires_at
-                    ) VALUES (%s, %s, %s, %s, %s, %s, NOW(), %s)
+                    ) VALUES (%s, %s, %s, %s, %s, %s, NOW(), to_timestamp(%s) AT TIME ZONE 'UTC')
                     ON CONFLICT (xpub_van, recipient_id) 
                     DO UPDATE SET
                         status = 'watching',
-                        expires_at = %s,
+                        expires_at = EXCLUDED.expires_at,
                         refresh_count = 0,
                         xpub_col = EXCLUDED.xpub_col,
                         master_fingerprint = EXCLUDED.master_fingerprint,
@@ -63,7 +63,7 @@ def create_watcher(
                 """, (
                     xpub_van, xpub_col, master_fingerprint, recipient_id, 
                     asset_id,
-                    'watching', expires_at_str, expires_at_str
+                    'watching', expires_at
                 ))
                 logger.debug(f"Created/updated watcher for {xpub_van}:{recipient_id}")
     except Exception as e:
@@ -157,15 +157,12 @@ def update_watcher_asset_and_expiration(
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 if expiration is not None:
-                    # Convert Unix timestamp to UTC datetime
-                    expires_at_dt = datetime.fromtimestamp(expiration, tz=timezone.utc)
-                    expires_at_str = expires_at_dt.strftime('%Y-%m-%d %H:%M:%S')
-                    
+                    # Unix timestamp is converted to naive UTC by PostgreSQL
                     cur.execute("""
                         UPDATE refresh_watchers
-                        SET asset_id = %s, expires_at = %s, last_refresh = NOW()
+                        SET asset_id = %s, expires_at = to_timestamp(%s) AT TIME ZONE 'UTC', last_refresh = NOW()
                         WHERE xpub_van = %s AND recipient_id = %s
-                    """, (asset_id, expires_at_str, xpub_van, recipient_id))
+                    """, (asset_id, expiration, xpub_van, recipient_id))
                 else:
                     cur.execute("""
                         UPDATE refresh_watchers
@@ -216,11 +213,7 @@ def get_active_watchers() -> List[Dict[str, Any]]:
                     AND (expires_at IS NULL OR expires_at > NOW())
                 """)
                 
-                watchers = []
-                for row in cur.fetchall():
-                    watcher = dict(row)
-                    _normalize_watcher_timestamps(watcher)
-                    watchers.append(watcher)
+                watchers = [_watcher_from_row(row) for row in cur.fetchall()]
                 
                 return watchers
     except Exception as e:
@@ -249,11 +242,7 @@ def get_active_watchers_for_wallet(xpub_van: str) -> List[Dict[str, Any]]:
                     ORDER BY created_at ASC
                 """, (xpub_van,))
                 
-                watchers = []
-                for row in cur.fetchall():
-                    watcher = dict(row)
-                    _normalize_watcher_timestamps(watcher)
-                    watchers.append(watcher)
+                watchers = [_watcher_from_row(row) for row in cur.fetchall()]
                 
                 return watchers
     except Exception as e:
@@ -261,6 +250,37 @@ def get_active_watchers_for_wallet(xpub_van: str) -> List[Dict[str, Any]]:
         return []
 
 
+def get_watcher_recipient_ids(xpub_van: str) -> Set[str]:
+    """
+    Get recipient IDs of all watchers for a wallet, in any status.
+    
+    Args:
+        xpub_van: Wallet identifier
+        
+    Returns:
+        Set of recipient IDs that already have a watcher row
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT recipient_id FROM refresh_watchers
+                    WHERE xpub_van = %s
+                """, (xpub_van,))
+                
+                return {row[0] for row in cur.fetchall()}
+    except Exception as e:
+        logger.error(f"Failed to get watcher recipient ids for wallet: {e}")
+        return set()
+
+
+def _watcher_from_row(row) -> Dict[str, Any]:
+    """Convert a RealDictCursor row into a watcher dictionary with Unix timestamps."""
+    watcher = dict(row)
+    _normalize_watcher_timestamps(watcher)
+    return watcher
+
+
 def _normalize_watcher_timestamps(watcher: Dict[str, Any]) -> None:
     """
     Normalize watcher timestamp fields to Unix timestamps.
@@ -2,11 +2,11 @@
 """Module containing models related to RGB."""
 from __future__ import annotations
 
-from datetime import datetime
 import enum
 from typing import Any, List, Literal, Optional, Union
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import model_validator
 
 from src.constant import FEE_RATE_FOR_CREATE_UTXOS
@@ -20,6 +20,12 @@ class CommonException(Exception):
     pass
 
 
+class ReadOnlyModel(BaseModel):
+    """Base for response models built from trusted rgb_lib results and never mutated."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
 class StatusModel(BaseModel):
     """Response status model."""
 
@@ -58,7 +64,7 @@ class SendBtcEndRequestModel(BaseModel):
 class GetFeeEstimateRequestModel(BaseModel):
     blocks: int
 
-class RegisterModel(BaseModel):
+class RegisterModel(ReadOnlyModel):
     address: str
     btc_balance: BtcBalance
 
@@ -76,8 +82,8 @@ class Recipient(BaseModel):
 class SendAssetBeginRequestModel(BaseModel):
     invoice: str | None = None
     asset_id: str| None = None
-    recipient_id: str= None
-    amount: int= None
+    recipient_id: Optional[str] = None
+    amount: Optional[int] = None
     witness_data: Optional[WitnessData] = None
     fee_rate: Optional[int] = None
     min_confirmations: Optional[int] = None
@@ -89,7 +95,7 @@ class SendAssetBeginModel(BaseModel):
     fee_rate: int = 5
     min_confirmations: int = 1
 
-class OperationResult(BaseModel):
+class OperationResult(ReadOnlyModel):
     txid: str
     batch_transfer_idx: int
 
@@ -147,7 +153,7 @@ class SignPSBT(BaseModel):
     master_fingerprint: str
 
 
-class Media(BaseModel):
+class Media(ReadOnlyModel):
     """Model for list asset"""
     file_path: str
     digest: str
@@ -155,7 +161,7 @@ class Media(BaseModel):
     mime: str
 
 
-class Balance(BaseModel):
+class Balance(ReadOnlyModel):
     """Model for list asset"""
     settled: int
     future: int
@@ -194,22 +200,17 @@ class Unspent(BaseModel):
     utxo: Utxo
     rgb_allocations: List[RgbAllocation]
 
-class Balance(BaseModel):
-    settled: int
-    future: int
-    spendable: int
-
-class ReceiveData(BaseModel):
+class ReceiveData(ReadOnlyModel):
     invoice: str
     recipient_id: str
     expiration_timestamp: Optional[int]
     batch_transfer_idx: int
 
-class SendResult(BaseModel):
+class SendResult(ReadOnlyModel):
     txid: str
     batch_transfer_idx: int
 
-class BtcBalance(BaseModel):
+class BtcBalance(ReadOnlyModel):
     vanilla: Balance
     colored: Balance
 
@@ -220,7 +221,7 @@ class AssetIface(enum.IntEnum):
     
     RGB25 = 2
 
-class AssetNia(BaseModel):
+class AssetNia(ReadOnlyModel):
     asset_id: str
     # asset_iface: AssetIface
     ticker: str
@@ -233,7 +234,7 @@ class AssetNia(BaseModel):
     balance: Balance
     media: Optional[Media]
 
-class AssetIfa(BaseModel):
+class AssetIfa(ReadOnlyModel):
     asset_id: str
     ticker: str
     name: str
@@ -362,6 +363,8 @@ class SendAssetRequestModel(BaseModel):
 class ListTransfersRequestModel(AssetIdModel):
     """Request model for listing asset transfers."""
 
+    recipient_id: str | None = None
+
 class GetAssetMediaModelRequestModel(BaseModel):
     """Response model for get asset medial api"""
     digest: str
@@ -397,7 +400,7 @@ class DecodeRgbInvoiceResponseModel(BaseModel):
     transport_endpoints: list[str]
 
 
-class GetAssetResponseModel(BaseModel):
+class GetAssetResponseModel(ReadOnlyModel):
     """Response model for list assets."""
     nia: list[AssetModel | None] | None = []
     uda: list[AssetModel | None] | None = []
@@ -428,7 +431,7 @@ class RgbInvoiceDataResponseModel(BaseModel):
 
     recipient_id: str
     invoice: str
-    expiration_timestamp: datetime
+    expiration_timestamp: Optional[int]
     batch_transfer_idx: int
 
 
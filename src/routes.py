@@ -1,6 +1,6 @@
 from typing import List, Optional
 from fastapi import File, Form, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from src.dependencies import get_wallet, create_wallet
 from rgb_lib import BitcoinNetwork, Wallet, AssetSchema, Assignment
 from src.rgb_model import (
@@ -29,7 +29,6 @@ from src.rgb_model import (
     RefreshRequestModel,
     RegisterModel,
     RgbInvoiceRequestModel,
-    SendAssetBeginModel,
     SendAssetBeginRequestModel,
     SendAssetEndRequestModel,
     SendBatchBeginRequestModel,
@@ -42,7 +41,7 @@ from src.rgb_model import (
     Unspent,
     WatchOnly,
 )
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Request
 import os
 from src.wallet_utils import (
     BACKUP_PATH,
@@ -55,9 +54,13 @@ from src.wallet_utils import (
     WalletStateExistsError,
 )
 from src.refresh_queue import enqueue_refresh_job, get_job_status, get_watcher_status
+import hashlib
+import orjson
 import shutil
-import uuid
+import threading
+import time
 import logging
+import functools
 import rgb_lib
 
 logger = logging.getLogger(__name__)
@@ -66,13 +69,122 @@ env_network = int(os.getenv("NETWORK", "3"))
 NETWORK = BitcoinNetwork(env_network)
 
 router = APIRouter()
-invoices = {}
 PROXY_URL = os.getenv('PROXY_ENDPOINT')
 vanilla_keychain = 1
+# Built once and shared; rgb_lib only reads these arguments
+TRANSPORT_ENDPOINTS = [PROXY_URL]
+LISTED_ASSET_SCHEMAS = [AssetSchema.NIA, AssetSchema.IFA]
+
+# Decoded invoices are immutable per invoice string
+INVOICE_DECODE_CACHE_SIZE = int(os.getenv("INVOICE_DECODE_CACHE_SIZE", "1024"))
+
+# Short-lived per-wallet BTC balance cache; 0 disables it
+BTC_BALANCE_CACHE_TTL = float(os.getenv("BTC_BALANCE_CACHE_TTL", "1.5"))
+BTC_BALANCE_CACHE_MAX_ENTRIES = int(os.getenv("BTC_BALANCE_CACHE_MAX_ENTRIES", "1024"))
+_btc_balance_cache: dict[str, tuple[float, object]] = {}
+_btc_balance_locks: dict[str, threading.Lock] = {}
+# Callers holding or waiting on each wallet's lock; its lock and generation are kept while non-zero
+_btc_balance_lock_users: dict[str, int] = {}
+# Bumped on every invalidation so a fetch that started earlier cannot store its stale result
+_btc_balance_generations: dict[str, int] = {}
+_btc_balance_locks_guard = threading.Lock()
+
+
+def _get_cached_btc_balance(wallet: Wallet, online: object, xpub_van: str, force: bool = False):
+    """
+    Return the wallet's BTC balance, reusing a result younger than BTC_BALANCE_CACHE_TTL.
+    
+    Concurrent callers for the same wallet wait on a per-wallet lock so only
+    one of them syncs with the indexer; the others pick up its result.
+    With force=True the cached value is ignored and replaced by a fresh one.
+    """
+    if BTC_BALANCE_CACHE_TTL <= 0:
+        return wallet.get_btc_balance(online, True)
+    
+    cached = _btc_balance_cache.get(xpub_van)
+    if not force and cached and time.monotonic() - cached[0] < BTC_BALANCE_CACHE_TTL:
+        return cached[1]
+    
+    with _btc_balance_locks_guard:
+        lock = _btc_balance_locks.setdefault(xpub_van, threading.Lock())
+        _btc_balance_lock_users[xpub_van] = _btc_balance_lock_users.get(xpub_van, 0) + 1
+    try:
+        with lock:
+            cached = _btc_balance_cache.get(xpub_van)
+            if not force and cached and time.monotonic() - cached[0] < BTC_BALANCE_CACHE_TTL:
+                return cached[1]
+            with _btc_balance_locks_guard:
+                generation = _btc_balance_generations.get(xpub_van, 0)
+            btc_balance = wallet.get_btc_balance(online, True)
+            _store_btc_balance(xpub_van, btc_balance, generation)
+            return btc_balance
+    finally:
+        with _btc_balance_locks_guard:
+            users = _btc_balance_lock_users.pop(xpub_van) - 1
+            if users:
+                _btc_balance_lock_users[xpub_van] = users
+            elif xpub_van not in _btc_balance_cache:
+                _forget_btc_balance_lock(xpub_van)
+
+
+def _store_btc_balance(xpub_van: str, btc_balance, generation: int) -> None:
+    """
+    Cache a balance, evicting the least recently stored wallets beyond
+    BTC_BALANCE_CACHE_MAX_ENTRIES along with their idle locks.
+    
+    The write is dropped if the wallet was invalidated after generation was
+    read, since the balance may predate the operation that moved funds.
+    """
+    with _btc_balance_locks_guard:
+        if _btc_balance_generations.get(xpub_van, 0) != generation:
+            return
+        # Re-insert so dict order tracks recency
+        _btc_balance_cache.pop(xpub_van, None)
+        _btc_balance_cache[xpub_van] = (time.monotonic(), btc_balance)
+        while len(_btc_balance_cache) > BTC_BALANCE_CACHE_MAX_ENTRIES:
+            evicted = next(iter(_btc_balance_cache))
+            del _btc_balance_cache[evicted]
+            # Locks still in use are forgotten by their last caller instead
+            if evicted not in _btc_balance_lock_users:
+                _forget_btc_balance_lock(evicted)
+
+
+def _forget_btc_balance_lock(xpub_van: str) -> None:
+    """Drop an unused wallet's lock and generation; the caller holds _btc_balance_locks_guard."""
+    _btc_balance_locks.pop(xpub_van, None)
+    _btc_balance_generations.pop(xpub_van, None)
+
+
+def _invalidate_btc_balance(xpub_van: str) -> None:
+    """Drop the cached BTC balance after an operation that moves funds."""
+    with _btc_balance_locks_guard:
+        _btc_balance_cache.pop(xpub_van, None)
+        # A registered user may be mid-fetch, so fence it off; otherwise nothing can be in flight
+        if xpub_van in _btc_balance_lock_users:
+            _btc_balance_generations[xpub_van] = _btc_balance_generations.get(xpub_van, 0) + 1
+        else:
+            _forget_btc_balance_lock(xpub_van)
+
+
+@functools.lru_cache(maxsize=INVOICE_DECODE_CACHE_SIZE)
+def _decode_invoice(invoice: str):
+    """
+    Parse an RGB invoice string, reusing the result for repeated invoices.
+    
+    Invalid invoices raise and are not cached. Callers must treat the
+    returned InvoiceData as read-only since it is shared.
+    
+    Args:
+        invoice: RGB invoice string
+    
+    Returns:
+        rgb_lib InvoiceData
+    """
+    return rgb_lib.Invoice(invoice).invoice_data()
 
-
-@router.post("/wallet/generate_keys")
-def register_wallet():
+# operation_id keeps the schema id clients generated against before the handler rename
+@router.post("/wallet/generate_keys", operation_id="register_wallet_wallet_generate_keys_post")
+def generate_keys():
     send_keys = rgb_lib.generate_keys(NETWORK)
     return send_keys
 
@@ -97,6 +209,7 @@ def send_btc_begin(req: SendBtcBeginRequestModel, wallet_dep: tuple[Wallet, obje
 def send_btc_end(req: SendBtcEndRequestModel, wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet)):
     wallet, online,xpub_van, xpub_col = wallet_dep
     result = wallet.send_btc_end(online, req.signed_psbt, req.skip_sync)
+    _invalidate_btc_balance(xpub_van)
     return result
 # response_model=List[Unspent]
 @router.post("/wallet/listunspents")
@@ -115,6 +228,7 @@ def create_utxos_begin(req: CreateUtxosBegin, wallet_dep: tuple[Wallet, object,s
 def create_utxos_end(req: CreateUtxosEnd, wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet)):
     wallet, online,xpub_van, xpub_col = wallet_dep
     result = wallet.create_utxos_end(online, req.signed_psbt, False)
+    _invalidate_btc_balance(xpub_van)
     return result
 
 
@@ -130,21 +244,20 @@ def create_utxos_with_sign(
     signer = offline_wallet_instance(xpub_van, xpub_col, req.mnemonic, master_fingerprint)
     signed_psbt = signer.sign_psbt(psbt)
     result = wallet.create_utxos_end(online, signed_psbt, False)
+    _invalidate_btc_balance(xpub_van)
     return result
 
 
 @router.post("/wallet/listassets",response_model=GetAssetResponseModel)
 def list_assets(wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet)):
     wallet, online,xpub_van, xpub_col = wallet_dep
-    assets = wallet.list_assets([AssetSchema.NIA,AssetSchema.IFA])
+    assets = wallet.list_assets(LISTED_ASSET_SCHEMAS)
     return assets
 
 @router.post("/wallet/btcbalance",response_model=BtcBalance)
-def get_btc_balance(wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet)):
+def get_btc_balance(force: bool = False, wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet)):
     wallet, online,xpub_van, xpub_col = wallet_dep
-    print("Getting BTC balance...")
-    print(xpub_van, xpub_col)
-    btc_balance = wallet.get_btc_balance(online, True)
+    btc_balance = _get_cached_btc_balance(wallet, online, xpub_van, force)
     return btc_balance
 
 @router.post("/wallet/address",response_model=str)
@@ -175,6 +288,7 @@ def inflate_begin(req: InflateAssetIfaRequestModel, wallet_dep: tuple[Wallet, ob
 def inflate_end(req: InflateEndRequestModel, wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet)):
     wallet, online,xpub_van, xpub_col = wallet_dep
     result = wallet.inflate_end(online,req.signed_psbt)
+    _invalidate_btc_balance(xpub_van)
     return result
 
 @router.post("/wallet/assetbalance",response_model=Balance)
@@ -186,7 +300,7 @@ def get_asset_balance(req: AssetBalanceRequest, wallet_dep: tuple[Wallet, object
 @router.post("/wallet/decodergbinvoice")
 def decode_rgb_invoice(req:DecodeRgbInvoiceRequestModel, wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet) ):
     wallet, online,xpub_van, xpub_col = wallet_dep
-    invoice_data = rgb_lib.Invoice(req.invoice).invoice_data()
+    invoice_data = _decode_invoice(req.invoice)
     return invoice_data
 
 
@@ -195,14 +309,14 @@ def send_begin(req: SendAssetBeginRequestModel, wallet_dep: tuple[Wallet, object
     wallet, online,xpub_van, xpub_col = wallet_dep
     if req.invoice is None:
         raise HTTPException(status_code=400, detail="Invoice is required")
-    invoice_data = rgb_lib.Invoice(req.invoice).invoice_data()
+    invoice_data = _decode_invoice(req.invoice)
     resolved_amount = Assignment.FUNGIBLE(req.amount)
     if resolved_amount is None:
         raise HTTPException(status_code=400, detail="Amount is required")
     if not (invoice_data.asset_id or req.asset_id):
         raise HTTPException(status_code=400, detail="Missing asset_id: must be provided in invoice or request")
-    # Check if recipient_id contains "wvout:" to determine if it's a witness send
-    is_witness_send = "wvout:" in (invoice_data.recipient_id)
+    # Witness recipient ids contain "wvout:" after the network prefix (e.g. "bcrt:wvout:...")
+    is_witness_send = "wvout:" in invoice_data.recipient_id
     # Set witness_data based on whether it's a witness send
     if is_witness_send:
         if req.witness_data is None:
@@ -219,7 +333,7 @@ def send_begin(req: SendAssetBeginRequestModel, wallet_dep: tuple[Wallet, object
 
     recipient_map = {
         invoice_data.asset_id or req.asset_id: [
-            Recipient(
+            Recipient.model_construct(
                 recipient_id=invoice_data.recipient_id,
                 assignment=resolved_amount,
                 witness_data=witness_data,
@@ -229,22 +343,17 @@ def send_begin(req: SendAssetBeginRequestModel, wallet_dep: tuple[Wallet, object
     }
    
     default_confirmations = 1 if env_network != 0 else 3
-    send_model = SendAssetBeginModel(
-        recipient_map=recipient_map,
-        donation=req.donation,
-        fee_rate=req.fee_rate or 5,
-        min_confirmations=req.min_confirmations if req.min_confirmations is not None else default_confirmations
-    )
-    print("invoice data", recipient_map, send_model)
+    fee_rate = req.fee_rate or 5
+    min_confirmations = req.min_confirmations if req.min_confirmations is not None else default_confirmations
+    logger.debug(f"send_begin recipients={recipient_map} fee_rate={fee_rate} min_confirmations={min_confirmations}")
     
-    psbt = wallet.send_begin(online, send_model.recipient_map, send_model.donation, send_model.fee_rate, send_model.min_confirmations)
+    psbt = wallet.send_begin(online, recipient_map, req.donation, fee_rate, min_confirmations)
     return psbt
 
 @router.post("/wallet/sign")
 def sign_psbt(req: SignPSBT):
     wallet, online = test_wallet_instance(req.xpub_van, req.xpub_col, req.mnemonic, req.master_fingerprint)
     signed_psbt = wallet.sign_psbt(req.psbt)
-    print("signed_psbt", signed_psbt)
     return signed_psbt
 
 
@@ -255,47 +364,61 @@ def offlinesign_psbt(req: SignPSBT):
     return signed_psbt
 
 
-@router.post("/wallet/sendend", response_model=SendResult)
-def send_begin(
+def _enqueue_refresh_job_logged(description: str, **job_fields) -> None:
+    """
+    Enqueue a refresh job, logging instead of raising on queue failure.
+    
+    Scheduled through BackgroundTasks so the database round-trip runs after
+    the response has been sent.
+    
+    Args:
+        description: What the job is for, used in log messages
+        **job_fields: Keyword arguments for enqueue_refresh_job
+    """
+    try:
+        job_id = enqueue_refresh_job(**job_fields)
+        logger.info(f"Enqueued refresh job {job_id} for {description}")
+    except Exception as e:
+        logger.error(f"Failed to enqueue refresh job: {e}", exc_info=True)
+
+@router.post("/wallet/sendend", response_model=SendResult, operation_id="send_begin_wallet_sendend_post")
+def send_end(
     req: SendAssetEndRequestModel, 
+    background_tasks: BackgroundTasks,
     wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet),
     master_fingerprint: str = Header(..., alias="master-fingerprint")
 ):
     wallet, online,xpub_van, xpub_col = wallet_dep
     result = wallet.send_end(online, req.signed_psbt, False)
+    _invalidate_btc_balance(xpub_van)
     
-    try:
-        job_id = enqueue_refresh_job(
-            xpub_van=xpub_van,
-            xpub_col=xpub_col,
-            master_fingerprint=master_fingerprint,
-            trigger="asset_sent"
-        )
-        logger.info(f"Enqueued refresh job {job_id} for asset send")
-    except Exception as e:
-        logger.error(f"Failed to enqueue refresh job: {e}", exc_info=True)
+    background_tasks.add_task(
+        _enqueue_refresh_job_logged,
+        "asset send",
+        xpub_van=xpub_van,
+        xpub_col=xpub_col,
+        master_fingerprint=master_fingerprint,
+        trigger="asset_sent"
+    )
     
     return result
 
 
 def _normalize_recipient_map(recipient_map: dict[str, List[Recipient]]) -> dict:
     """Convert int assignments to Assignment.FUNGIBLE for wallet.send_begin."""
-    out = {}
-    for asset_id, recs in recipient_map.items():
-        out[asset_id] = []
-        for r in recs:
-            asn = r.assignment
-            if isinstance(asn, int):
-                asn = Assignment.FUNGIBLE(asn)
-            out[asset_id].append(
-                Recipient(
-                    recipient_id=r.recipient_id,
-                    assignment=asn,
-                    witness_data=r.witness_data,
-                    transport_endpoints=r.transport_endpoints,
-                )
+    # Recipients were validated with the request body, so skip re-validation
+    return {
+        asset_id: [
+            Recipient.model_construct(
+                recipient_id=r.recipient_id,
+                assignment=Assignment.FUNGIBLE(r.assignment) if isinstance(r.assignment, int) else r.assignment,
+                witness_data=r.witness_data,
+                transport_endpoints=r.transport_endpoints,
             )
-    return out
+            for r in recs
+        ]
+        for asset_id, recs in recipient_map.items()
+    }
 
 
 @router.post("/wallet/sendbatchbegin", response_model=str)
@@ -312,6 +435,7 @@ def send_batch_end(req: SendAssetEndRequestModel, wallet_dep: tuple[Wallet, obje
     """Finalize batch send with signed PSBT (like createutxosend)."""
     wallet, online, xpub_van, xpub_col = wallet_dep
     result = wallet.send_end(online, req.signed_psbt, False)
+    _invalidate_btc_balance(xpub_van)
     return result
 
 
@@ -328,99 +452,83 @@ def send_batch_with_sign(
     signer = offline_wallet_instance(xpub_van, xpub_col, req.mnemonic, master_fingerprint)
     signed_psbt = signer.sign_psbt(psbt)
     result = wallet.send_end(online, signed_psbt, False)
+    _invalidate_btc_balance(xpub_van)
     return result
 
 
-@router.post("/wallet/blindreceive", response_model=ReceiveData)
-def generate_invoice(
-    req: RgbInvoiceRequestModel, 
-    wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet),
-    master_fingerprint: str = Header(..., alias="master-fingerprint")
+def _receive_and_watch(
+    receive_fn,
+    req: RgbInvoiceRequestModel,
+    background_tasks: BackgroundTasks,
+    wallet_dep: tuple[Wallet, object, str, str],
+    master_fingerprint: str
 ):
-    wallet, online,xpub_van, xpub_col = wallet_dep
+    """
+    Create an invoice with the given wallet receive method and schedule its refresh watcher job.
+    
+    Args:
+        receive_fn: Unbound Wallet.blind_receive or Wallet.witness_receive
+        req: Invoice request
+        background_tasks: Request background tasks used for the enqueue
+        wallet_dep: Wallet dependency tuple
+        master_fingerprint: Master fingerprint header value
+    
+    Returns:
+        ReceiveData from rgb_lib
+    """
+    wallet, online, xpub_van, xpub_col = wallet_dep
     assignment = Assignment.FUNGIBLE(req.amount)
-    duration_seconds=1500
+    duration_seconds = 1500
     min_conf = 1 if env_network != 0 else 3
-    receive = wallet.blind_receive(req.asset_id, assignment, duration_seconds, [PROXY_URL], min_conf)
+    receive = receive_fn(wallet, req.asset_id, assignment, duration_seconds, TRANSPORT_ENDPOINTS, min_conf)
     
-    try:
-        job_id = enqueue_refresh_job(
-            xpub_van=xpub_van,
-            xpub_col=xpub_col,
-            master_fingerprint=master_fingerprint,
-            trigger="invoice_created",
-            recipient_id=receive.recipient_id,
-            asset_id=req.asset_id
-        )
-        logger.info(f"Enqueued refresh job {job_id} for invoice {receive.recipient_id}")
-    except Exception as e:
-        logger.error(f"Failed to enqueue refresh job: {e}", exc_info=True)
-        # Don't fail the request if queue fails
+    # Enqueue refresh watcher job for invoice once the response is out
+    background_tasks.add_task(
+        _enqueue_refresh_job_logged,
+        f"invoice {receive.recipient_id}",
+        xpub_van=xpub_van,
+        xpub_col=xpub_col,
+        master_fingerprint=master_fingerprint,
+        trigger="invoice_created",
+        recipient_id=receive.recipient_id,
+        asset_id=req.asset_id
+    )
     
     return receive
 
-# old methot should be removed after prod update
-@router.post("/blindreceive", response_model=ReceiveData)
+@router.post("/wallet/blindreceive", response_model=ReceiveData)
 def generate_invoice(
     req: RgbInvoiceRequestModel, 
+    background_tasks: BackgroundTasks,
     wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet),
     master_fingerprint: str = Header(..., alias="master-fingerprint")
 ):
-    wallet, online,xpub_van, xpub_col = wallet_dep
-    assignment = Assignment.FUNGIBLE(req.amount)
-    duration_seconds=1500
-    min_conf = 1 if env_network != 0 else 3
-    receive = wallet.blind_receive(req.asset_id, assignment, duration_seconds, [PROXY_URL], min_conf)
-    
-    try:
-        job_id = enqueue_refresh_job(
-            xpub_van=xpub_van,
-            xpub_col=xpub_col,
-            master_fingerprint=master_fingerprint,
-            trigger="invoice_created",
-            recipient_id=receive.recipient_id,
-            asset_id=req.asset_id
-        )
-        logger.info(f"Enqueued refresh job {job_id} for invoice {receive.recipient_id}")
-    except Exception as e:
-        logger.error(f"Failed to enqueue refresh job: {e}", exc_info=True)
-        # Don't fail the request if queue fails
-    
-    return receive
+    return _receive_and_watch(Wallet.blind_receive, req, background_tasks, wallet_dep, master_fingerprint)
 
-@router.post("/wallet/witnessreceive", response_model=ReceiveData)
-def generate_invoice(
+# old methot should be removed after prod update
+@router.post("/blindreceive", response_model=ReceiveData, operation_id="generate_invoice_blindreceive_post")
+def generate_invoice_legacy(
     req: RgbInvoiceRequestModel, 
+    background_tasks: BackgroundTasks,
     wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet),
     master_fingerprint: str = Header(..., alias="master-fingerprint")
 ):
-    wallet, online,xpub_van, xpub_col = wallet_dep
-    assignment = Assignment.FUNGIBLE(req.amount)
-    duration_seconds=1500
-    min_conf = 1 if env_network != 0 else 3
-    receive = wallet.witness_receive(req.asset_id, assignment, duration_seconds, [PROXY_URL], min_conf)
-    
-    # Enqueue refresh watcher job for invoice
-    try:
-        job_id = enqueue_refresh_job(
-            xpub_van=xpub_van,
-            xpub_col=xpub_col,
-            master_fingerprint=master_fingerprint,
-            trigger="invoice_created",
-            recipient_id=receive.recipient_id,
-            asset_id=req.asset_id
-        )
-        logger.info(f"Enqueued refresh job {job_id} for invoice {receive.recipient_id}")
-    except Exception as e:
-        logger.error(f"Failed to enqueue refresh job: {e}", exc_info=True)
-        # Don't fail the request if queue fails
-    
-    return receive
+    return _receive_and_watch(Wallet.blind_receive, req, background_tasks, wallet_dep, master_fingerprint)
+
+@router.post("/wallet/witnessreceive", response_model=ReceiveData, operation_id="generate_invoice_wallet_witnessreceive_post")
+def generate_witness_invoice(
+    req: RgbInvoiceRequestModel, 
+    background_tasks: BackgroundTasks,
+    wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet),
+    master_fingerprint: str = Header(..., alias="master-fingerprint")
+):
+    return _receive_and_watch(Wallet.witness_receive, req, background_tasks, wallet_dep, master_fingerprint)
 
 @router.post("/wallet/failtransfers")
 def failtransfers(req: FailTransferRequestModel, wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet)):
     wallet, online,xpub_van, xpub_col = wallet_dep
     failed = wallet.fail_transfers(online, req.batch_transfer_idx, req.no_asset_only, req.skip_sync)
+    _invalidate_btc_balance(xpub_van)
     return {'failed': failed}
 
 @router.post("/wallet/listtransactions")
@@ -434,12 +542,16 @@ def list_transfers(req:ListTransfersRequestModel, wallet_dep: tuple[Wallet, obje
     wallet, online,xpub_van, xpub_col = wallet_dep
     
     list_transfers = wallet.list_transfers(req.asset_id)
+    # Watchers poll for a single transfer; only send back the matching entries
+    if req.recipient_id is not None:
+        list_transfers = [t for t in list_transfers if t.recipient_id == req.recipient_id]
     return list_transfers
 
 @router.post("/wallet/refresh")
 def refresh_wallet(wallet_dep: tuple[Wallet, object,str,str]=Depends(get_wallet)):
     wallet, online,xpub_van, xpub_col = wallet_dep
     refreshed_transfers = wallet.refresh(online,None, [], False)
+    _invalidate_btc_balance(xpub_van)
     return refreshed_transfers
 
 @router.post("/wallet/sync")
@@ -448,6 +560,7 @@ def wallet_sync(
 ):
     wallet, online, xpub_van, xpub_col = wallet_dep
     wallet.sync(online)
+    _invalidate_btc_balance(xpub_van)
     return {"message": "Wallet synced successfully"}
 
 
@@ -519,29 +632,44 @@ def restore_wallet(
 ):
     remove_backup_if_exists(xpub_van)
     backup_path = get_backup_path(xpub_van)
-    print(backup_path)
+    logger.debug(f"Writing uploaded backup to {backup_path}")
     with open(backup_path, "wb") as buffer:
         shutil.copyfileobj(file.file, buffer)
     try:
         restore_wallet_instance(xpub_van,xpub_col,master_fingerprint, password, backup_path)
+        _invalidate_btc_balance(xpub_van)
         return {"message": "Wallet restored successfully"}
     except WalletStateExistsError as exc:
         raise HTTPException(status_code=409, detail=str(exc))
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to restore wallet: {str(e)}")
 
+def _conditional_json_response(request: Request, payload: dict) -> Response:
+    """
+    Serialize payload with a weak ETag and answer 304 when the client already has it.
+    
+    Status endpoints are polled; no-cache makes clients revalidate every time
+    while unchanged statuses cost only an empty 304.
+    """
+    body = orjson.dumps(payload)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @router.get("/wallet/refresh/status/{job_id}")
-def get_refresh_job_status(job_id: str):
+def get_refresh_job_status(job_id: str, request: Request):
     """Get status of a refresh job."""
     status = get_job_status(job_id)
     if not status:
         raise HTTPException(status_code=404, detail="Job not found")
-    return status
+    return _conditional_json_response(request, status)
 
 @router.get("/wallet/refresh/watcher/{xpub_van}/{recipient_id}")
-def get_refresh_watcher_status(xpub_van: str, recipient_id: str):
+def get_refresh_watcher_status(xpub_van: str, recipient_id: str, request: Request):
     """Get status of a refresh watcher for a specific recipient."""
     status = get_watcher_status(xpub_van, recipient_id)
     if not status:
         raise HTTPException(status_code=404, detail="Watcher not found")
-    return status
+    return _conditional_json_response(request, status)
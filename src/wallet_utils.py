@@ -1,17 +1,39 @@
 import os
 import json
 import glob
+import logging
+import threading
+from dataclasses import dataclass
 from rgb_lib import Wallet,restore_backup, WalletData, BitcoinNetwork, DatabaseType,AssetSchema
-print("NETWORK raw =", os.getenv("NETWORK"))
-print("INDEXER_URL raw =", os.getenv("INDEXER_URL"))
-print("PROXY_ENDPOINT raw =", os.getenv("PROXY_ENDPOINT"))
+
+logger = logging.getLogger(__name__)
 env_network = int(os.getenv("NETWORK", "3"))
 NETWORK = BitcoinNetwork(env_network)
 BASE_PATH = "./data"
 RESTORED_PATH = './data'
 BACKUP_PATH = './backup'
 vanilla_keychain = 1
-wallet_instances: dict[str, dict[str, object]] = {}
+SUPPORTED_SCHEMAS = [AssetSchema.NIA, AssetSchema.CFA, AssetSchema.UDA, AssetSchema.IFA]
+OFFLINE_SUPPORTED_SCHEMAS = [AssetSchema.NIA, AssetSchema.CFA, AssetSchema.UDA]
+# WalletData fields shared by every wallet this service opens
+WALLET_DATA_DEFAULTS = {
+    "bitcoin_network": NETWORK,
+    "database_type": DatabaseType.SQLITE,
+    "max_allocations_per_utxo": 1,
+    "vanilla_keychain": vanilla_keychain,
+}
+
+@dataclass(frozen=True, slots=True)
+class WalletInstance:
+    """Opened wallet and its online handle, cached per client."""
+    wallet: Wallet
+    online: object
+
+wallet_instances: dict[str, WalletInstance] = {}
+# Fixed pool of striped locks so concurrent first requests open a wallet only once
+# without keeping a lock around for every client ever seen
+WALLET_LOCK_STRIPES = 64
+_wallet_locks = [threading.Lock() for _ in range(WALLET_LOCK_STRIPES)]
 INDEXER_URL = os.getenv('INDEXER_URL')
 
 if INDEXER_URL is None:
@@ -24,6 +46,15 @@ class WalletStateExistsError(Exception):
     """Raised when attempting to restore over an existing wallet state."""
     pass
 
+def _get_wallet_lock(client_id: str) -> threading.Lock:
+    return _wallet_locks[hash(client_id) % WALLET_LOCK_STRIPES]
+
+def _get_cached_instance(client_id: str):
+    instance = wallet_instances.get(client_id)
+    if instance is not None:
+        return instance.wallet, instance.online
+    return None
+
 def get_wallet_path(client_id: str):
     return os.path.join(BASE_PATH, client_id)
 def get_restored_wallet_path(client_id: str):
@@ -40,7 +71,7 @@ def remove_backup_if_exists(client_id: str):
         except FileNotFoundError:
             continue
     if removed:
-        print(f"Removed existing backups for {client_id} matching {pattern}")
+        logger.info(f"Removed existing backups for {client_id} matching {pattern}")
 
 def get_backup_path(client_id: str): 
     os.makedirs(BACKUP_PATH, exist_ok=True)
@@ -64,38 +95,35 @@ def load_wallet_config(client_id: str):
 
 def create_wallet_instance(xpub_van: str,xpub_col: str,master_fingerprint:str):
     client_id=xpub_van
-    if client_id in wallet_instances:
-        instance = wallet_instances[client_id]
-        if instance.get("wallet") and instance.get("online"):
-            return instance["wallet"], instance["online"]
+    cached = _get_cached_instance(client_id)
+    if cached is not None:
+        return cached
+    with _get_wallet_lock(client_id):
+        cached = _get_cached_instance(client_id)
+        if cached is not None:
+            return cached
         
-    config_path = get_wallet_path(client_id)
-
-    if not os.path.exists(config_path):
-        os.makedirs(get_wallet_path(client_id), exist_ok=True)
-        # raise WalletNotFoundError(f"Wallet for client '{client_id}' does not exist.")
-    print("init wallet network:",NETWORK)
-    wallet_data = WalletData(
-        data_dir=get_wallet_path(client_id),
-        bitcoin_network=NETWORK,
-        database_type=DatabaseType.SQLITE,
-        account_xpub_vanilla=xpub_van,
-        account_xpub_colored=xpub_col,
-        mnemonic=None,
-        max_allocations_per_utxo=1,
-        vanilla_keychain=vanilla_keychain,
-        master_fingerprint=master_fingerprint,
-        supported_schemas=[AssetSchema.NIA,AssetSchema.CFA,AssetSchema.UDA,AssetSchema.IFA]
-    )
-    wallet = Wallet(wallet_data)
-    print("prepere online",INDEXER_URL)
-    online = wallet.go_online(False,INDEXER_URL)
-    print("wallet online")
-    wallet_instances[client_id] = {
-        "wallet": wallet,
-        "online": online
-    }
-    return wallet, online
+        config_path = get_wallet_path(client_id)
+
+        if not os.path.exists(config_path):
+            os.makedirs(get_wallet_path(client_id), exist_ok=True)
+            # raise WalletNotFoundError(f"Wallet for client '{client_id}' does not exist.")
+        logger.debug(f"init wallet network: {NETWORK}")
+        wallet_data = WalletData(
+            **WALLET_DATA_DEFAULTS,
+            data_dir=get_wallet_path(client_id),
+            account_xpub_vanilla=xpub_van,
+            account_xpub_colored=xpub_col,
+            mnemonic=None,
+            master_fingerprint=master_fingerprint,
+            supported_schemas=SUPPORTED_SCHEMAS
+        )
+        wallet = Wallet(wallet_data)
+        logger.debug(f"prepare online {INDEXER_URL}")
+        online = wallet.go_online(False,INDEXER_URL)
+        logger.debug("wallet online")
+        wallet_instances[client_id] = WalletInstance(wallet, online)
+        return wallet, online
 
 def upload_backup(client_id: str):
     remove_backup_if_exists(client_id)
@@ -113,42 +141,33 @@ def restore_wallet_instance(xpub_van: str,xpub_col: str,master_fingerprint:str,
 
     os.makedirs(restore_path, exist_ok=True)
 
-    print("restore_backup",backup_path, password, restore_path)
+    logger.info(f"restore_backup {backup_path} -> {restore_path}")
     restore_backup(backup_path, password, restore_path)
     wallet_data = WalletData(
+        **WALLET_DATA_DEFAULTS,
         data_dir=restore_path,
-        bitcoin_network=NETWORK,
-        database_type=DatabaseType.SQLITE,
         account_xpub_vanilla=xpub_van,
         account_xpub_colored=xpub_col,
         mnemonic=None,
-        max_allocations_per_utxo=1,
-        vanilla_keychain=vanilla_keychain,
         master_fingerprint=master_fingerprint,
-        supported_schemas=[AssetSchema.NIA,AssetSchema.CFA,AssetSchema.UDA,AssetSchema.IFA]
+        supported_schemas=SUPPORTED_SCHEMAS
     )
     wallet = Wallet(wallet_data)
     online = wallet.go_online(False,INDEXER_URL)
-    wallet_instances[client_id] = {
-        "wallet": wallet,
-        "online": online
-    }
+    wallet_instances[client_id] = WalletInstance(wallet, online)
     return wallet, online
 
 def offline_wallet_instance(xpub_van: str,xpub_col: str,mnemonic: str = None,master_fingerprint: str = None):  
     client_id=xpub_van
     wallet_data = WalletData(
+        **WALLET_DATA_DEFAULTS,
         data_dir=get_wallet_path(client_id),
-        bitcoin_network=NETWORK,
-        database_type=DatabaseType.SQLITE,
         account_xpub_vanilla=xpub_van,
         account_xpub_colored=xpub_col,
         mnemonic=mnemonic,
-        max_allocations_per_utxo=1,
-        vanilla_keychain=vanilla_keychain,
         master_fingerprint=master_fingerprint,
-        supported_schemas=[AssetSchema.NIA,AssetSchema.CFA,AssetSchema.UDA]
-    ) 
+        supported_schemas=OFFLINE_SUPPORTED_SCHEMAS
+    )
     wallet = Wallet(wallet_data)
     return wallet
 
@@ -159,60 +178,50 @@ def test_wallet_instance(xpub_van: str,xpub_col: str,mnemonic: str = None,master
     #     if instance.get("wallet") and instance.get("online"):
     #         return instance["wallet"], instance["online"]
     # config_path = get_wallet_path(client_id)
-    # print("load_wallet_instance",config_path)
     # if not os.path.exists(config_path):
     #     os.makedirs(get_wallet_path(client_id), exist_ok=True)
 
     wallet_data = WalletData(
+        **WALLET_DATA_DEFAULTS,
         data_dir=get_wallet_path(client_id),
-        bitcoin_network=NETWORK,
-        database_type=DatabaseType.SQLITE,
         account_xpub_vanilla=xpub_van,
         account_xpub_colored=xpub_col,
         mnemonic=mnemonic,
-        max_allocations_per_utxo=1,
-        vanilla_keychain=vanilla_keychain,
         master_fingerprint=master_fingerprint,
-        supported_schemas=[AssetSchema.NIA,AssetSchema.CFA,AssetSchema.UDA,AssetSchema.IFA]
+        supported_schemas=SUPPORTED_SCHEMAS
     )
     wallet = Wallet(wallet_data)
     online = wallet.go_online(False, INDEXER_URL)
-    wallet_instances[client_id] = {
-        "wallet": wallet,
-        "online": online
-    }
+    wallet_instances[client_id] = WalletInstance(wallet, online)
     return wallet, online
 
 def load_wallet_instance(xpub_van: str,xpub_col: str,master_fingerprint:str):
     client_id=xpub_van
-    if client_id in wallet_instances:
-        instance = wallet_instances[client_id]
-        if instance.get("wallet") and instance.get("online"):
-            return instance["wallet"], instance["online"]
-    config_path = get_wallet_path(client_id)
-    print("load_wallet_instance",config_path)
-    if not os.path.exists(config_path):
-        raise WalletNotFoundError(f"Wallet for client '{client_id}' does not exist.")
-
-    wallet_data = WalletData(
-        data_dir=get_wallet_path(client_id),
-        bitcoin_network=NETWORK,
-        database_type=DatabaseType.SQLITE,
-        account_xpub_vanilla=xpub_van,
-        account_xpub_colored=xpub_col,
-        mnemonic=None,
-        max_allocations_per_utxo=1,
-        vanilla_keychain=vanilla_keychain,
-         master_fingerprint=master_fingerprint,
-        supported_schemas=[AssetSchema.NIA,AssetSchema.CFA,AssetSchema.UDA,AssetSchema.IFA]
-    )
-    wallet = Wallet(wallet_data)
-    online = wallet.go_online(False, INDEXER_URL)
-    wallet_instances[client_id] = {
-        "wallet": wallet,
-        "online": online
-    }
-    return wallet, online
+    cached = _get_cached_instance(client_id)
+    if cached is not None:
+        return cached
+    with _get_wallet_lock(client_id):
+        cached = _get_cached_instance(client_id)
+        if cached is not None:
+            return cached
+        config_path = get_wallet_path(client_id)
+        logger.debug(f"load_wallet_instance {config_path}")
+        if not os.path.exists(config_path):
+            raise WalletNotFoundError(f"Wallet for client '{client_id}' does not exist.")
+
+        wallet_data = WalletData(
+            **WALLET_DATA_DEFAULTS,
+            data_dir=get_wallet_path(client_id),
+            account_xpub_vanilla=xpub_van,
+            account_xpub_colored=xpub_col,
+            mnemonic=None,
+            master_fingerprint=master_fingerprint,
+            supported_schemas=SUPPORTED_SCHEMAS
+        )
+        wallet = Wallet(wallet_data)
+        online = wallet.go_online(False, INDEXER_URL)
+        wallet_instances[client_id] = WalletInstance(wallet, online)
+        return wallet, online
 
 def refresh_wallet_instance(client_id: str):
     if client_id in wallet_instances:
@@ -4,11 +4,12 @@ FastAPI client for refresh worker.
 Handles HTTP communication with the FastAPI service.
 """
 import logging
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional, List
-from workers.config import API_URL, HTTP_TIMEOUT
+from workers.config import API_URL, HTTP_TIMEOUT, HTTP_POOL_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -21,13 +22,14 @@ class APIClient:
     HTTP client for FastAPI service with retry logic.
     """
     
-    def __init__(self, base_url: str, timeout: int = 60):
+    def __init__(self, base_url: str, timeout: int = 60, pool_size: int = 10):
         """
         Initialize API client.
         
         Args:
             base_url: Base URL of the FastAPI service
             timeout: Request timeout in seconds
+            pool_size: Number of keep-alive connections pooled per host
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
@@ -42,12 +44,36 @@ class APIClient:
         )
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=10
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """
+        Decode a JSON response body with orjson.
+        
+        Decode errors are raised as requests' InvalidJSONError so callers'
+        RequestException handling keeps covering them.
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.InvalidJSONError(
+                f"Invalid JSON in response from {response.url}: {e}", response=response
+            ) from e
+    
+    @staticmethod
+    def _wallet_headers(job: Dict[str, Any]) -> Dict[str, str]:
+        """Build the wallet identification headers every wallet endpoint expects."""
+        return {
+            'xpub-van': job['xpub_van'],
+            'xpub-col': job['xpub_col'],
+            'master-fingerprint': job['master_fingerprint'],
+        }
+    
     def refresh_wallet(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """
         Call /wallet/refresh endpoint to sync wallet state.
@@ -67,11 +93,7 @@ class APIClient:
             if field not in job:
                 raise ValueError(f"Missing required field in job: {field}")
         
-        headers = {
-            'xpub-van': job['xpub_van'],
-            'xpub-col': job['xpub_col'],
-            'master-fingerprint': job['master_fingerprint']
-        }
+        headers = self._wallet_headers(job)
         
         try:
             response = self.session.post(
@@ -80,7 +102,7 @@ class APIClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return self._parse_json(response)
         except requests.exceptions.Timeout as e:
             logger.error(f"Timeout calling refresh API: {e}")
             raise
@@ -106,11 +128,7 @@ class APIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        headers = {
-            'xpub-van': job['xpub_van'],
-            'xpub-col': job['xpub_col'],
-            'master-fingerprint': job['master_fingerprint']
-        }
+        headers = self._wallet_headers(job)
         
         try:
             response = self.session.post(
@@ -119,7 +137,7 @@ class APIClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            result = response.json()
+            result = self._parse_json(response)
             
             # API returns GetAssetResponseModel with nia, uda, cfa fields
             assets = []
@@ -140,13 +158,19 @@ class APIClient:
             logger.error(f"Error calling listassets API: {e}")
             raise
     
-    def list_transfers(self, job: Dict[str, Any], asset_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_transfers(
+        self,
+        job: Dict[str, Any],
+        asset_id: Optional[str] = None,
+        recipient_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         List transfers for a specific asset or all transfers if asset_id is None.
         
         Args:
             job: Job dictionary with wallet credentials
             asset_id: Optional asset ID to list transfers for. If None, lists all transfers.
+            recipient_id: Optional recipient ID; the API then returns only matching transfers
             
         Returns:
             List of transfer dictionaries
@@ -154,17 +178,15 @@ class APIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        headers = {
-            'xpub-van': job['xpub_van'],
-            'xpub-col': job['xpub_col'],
-            'master-fingerprint': job['master_fingerprint']
-        }
+        headers = self._wallet_headers(job)
         
         try:
             # Only include asset_id in request if it's not None
             request_body = {}
             if asset_id is not None:
                 request_body['asset_id'] = asset_id
+            if recipient_id is not None:
+                request_body['recipient_id'] = recipient_id
             
             response = self.session.post(
                 f"{self.base_url}/wallet/listtransfers",
@@ -173,7 +195,7 @@ class APIClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            result = response.json()
+            result = self._parse_json(response)
             
             # API returns ListTransferAssetResponseModel with 'transfers' field
             if isinstance(result, dict) and 'transfers' in result:
@@ -200,15 +222,17 @@ class APIClient:
         Returns:
             Transfer dictionary or None if not found
         """
-        headers = {
-            'xpub-van': job['xpub_van'],
-            'xpub-col': job['xpub_col'],
-            'master-fingerprint': job['master_fingerprint']
-        }
+        headers = self._wallet_headers(job)
         
         try:
-            # Only include asset_id in request if it's not None
-            request_body = {}
+            recipient_id = job.get('recipient_id')
+            if not recipient_id:
+                logger.warning("get_transfer_status called without recipient_id")
+                return None
+            
+            # Filter server-side so only the matching transfer comes over the wire;
+            # only include asset_id in request if it's not None
+            request_body = {'recipient_id': recipient_id}
             asset_id = job.get('asset_id')
             if asset_id is not None:
                 request_body['asset_id'] = asset_id
@@ -220,19 +244,13 @@ class APIClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            transfers = response.json()
+            transfers = self._parse_json(response)
             
-            recipient_id = job.get('recipient_id')
-            if not recipient_id:
-                logger.warning("get_transfer_status called without recipient_id")
-                return None
-            
-            # Find matching transfer by recipient_id
-            for transfer in transfers:
-                if transfer.get('recipient_id') == recipient_id:
-                    return transfer
-            
-            return None
+            # The API already filtered by recipient_id; re-check in case it predates that
+            return next(
+                (t for t in transfers if t and t.get('recipient_id') == recipient_id),
+                None
+            )
         except requests.exceptions.RequestException as e:
             logger.warning(f"Error calling listtransfers API: {e}")
             return None
@@ -259,11 +277,7 @@ class APIClient:
             if field not in job:
                 raise ValueError(f"Missing required field in job: {field}")
         
-        headers = {
-            'xpub-van': job['xpub_van'],
-            'xpub-col': job['xpub_col'],
-            'master-fingerprint': job['master_fingerprint']
-        }
+        headers = self._wallet_headers(job)
         
         payload = {
             'batch_transfer_idx': batch_transfer_idx,
@@ -279,7 +293,7 @@ class APIClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return self._parse_json(response)
         except requests.exceptions.Timeout as e:
             logger.error(f"Timeout calling failtransfers API: {e}")
             raise
@@ -319,6 +333,6 @@ def get_api_client() -> APIClient:
     """
     global _api_client
     if _api_client is None:
-        _api_client = APIClient(API_URL, HTTP_TIMEOUT)
+        _api_client = APIClient(API_URL, HTTP_TIMEOUT, HTTP_POOL_SIZE)
     return _api_client
 
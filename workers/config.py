@@ -11,6 +11,7 @@ load_dotenv(override=True)
 # API Configuration
 API_URL = os.getenv("API_URL", "http://localhost:8000")
 HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", "60"))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))  # Keep-alive connections kept per host by the shared API client
 
 # Worker Configuration
 REFRESH_INTERVAL = int(os.getenv("REFRESH_INTERVAL", "30"))
@@ -22,10 +23,12 @@ POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "1"))
 WALLET_WORKER_IDLE_TIMEOUT = int(os.getenv("WALLET_WORKER_IDLE_TIMEOUT", "60"))  # Seconds before terminating idle process
 WALLET_WORKER_POLL_INTERVAL = int(os.getenv("WALLET_WORKER_POLL_INTERVAL", "5"))  # How often to check for work
 MAX_WALLET_PROCESSES = int(os.getenv("MAX_WALLET_PROCESSES", "50"))  # Maximum concurrent wallet worker processes
+ASSET_FETCH_CONCURRENCY = int(os.getenv("ASSET_FETCH_CONCURRENCY", "4"))  # Parallel per-asset listtransfers calls per wallet
 
 # Watcher Configuration
 INVOICE_WATCHER_EXPIRATION = int(os.getenv("INVOICE_WATCHER_EXPIRATION", "180"))  # 3 minutes for invoice_created without asset_id
 WALLET_LOCK_TTL = int(os.getenv("WALLET_LOCK_TTL", "30"))  # Wallet lock TTL in seconds
+WATCHER_INITIAL_POLL_INTERVAL = float(os.getenv("WATCHER_INITIAL_POLL_INTERVAL", "5"))  # First watcher poll delay; grows 1.5x per cycle up to REFRESH_INTERVAL
 
 # Logging Configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -60,7 +60,7 @@ def process_job(job: dict, shutdown_flag: callable) -> None:
             f"recipient_id={job_obj.recipient_id}, asset_id={job_obj.asset_id}"
         )
         
-        process_wallet_unified(job, shutdown_flag)
+        process_wallet_unified(job_obj, shutdown_flag)
         mark_job_completed(job_id)
     except Exception as e:
         logger.error(
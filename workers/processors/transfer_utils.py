@@ -4,8 +4,14 @@ Transfer utility functions.
 Shared functions for checking transfer status across different processors.
 """
 import time
+import logging
 from typing import Dict, Any, Optional
 from src.constant import RGB_INVOICE_DURATION_SECONDS
+from workers.api.client import get_api_client
+from workers.models import WalletCredentials
+from workers.utils import format_wallet_id
+
+logger = logging.getLogger(__name__)
 
 
 def get_transfer_identifier(transfer: Optional[Dict[str, Any]] = None, job: Optional[Dict[str, Any]] = None) -> Optional[str]:
@@ -35,23 +41,65 @@ def get_transfer_identifier(transfer: Optional[Dict[str, Any]] = None, job: Opti
     return None
 
 
-def is_transfer_completed(transfer: Dict[str, Any]) -> bool:
-    """Check if transfer is in terminal state."""
-    status = transfer.get('status')
+# TransferStatus / TransferKind integer values as serialized by rgb_lib
+_STATUS_NAMES = {
+    0: 'WAITING_COUNTERPARTY',
+    1: 'WAITING_CONFIRMATIONS',
+    2: 'SETTLED',
+    3: 'FAILED',
+}
+_KIND_NAMES = {
+    1: 'RECEIVE_BLIND',
+}
+
+
+def _enum_name(value: Any, names: Dict[int, str]) -> Optional[str]:
+    """
+    Normalize an rgb_lib enum field to its upper-case name.
+    
+    Handles enum objects (not serialized), integer enum values and strings
+    (most common from JSON serialization).
+    
+    Args:
+        value: Enum object, integer value or string
+        names: Mapping of known integer values to names
+    
+    Returns:
+        Upper-case name, or None if it cannot be determined
+    """
+    if hasattr(value, 'name'):
+        return value.name.upper()
+    if isinstance(value, int):
+        return names.get(value)
+    if isinstance(value, str):
+        return value.upper()
+    return None
+
+
+def normalize_transfer_status(status: Any) -> str:
+    """
+    Normalize transfer status to string.
     
-    # Handle enum object (if not serialized)
-    if hasattr(status, 'name'):
-        status = status.name
-    # Handle enum value (integer)
-    elif isinstance(status, int):
-        # TransferStatus: SETTLED=2, FAILED=3
-        return status in [2, 3]
+    Handles enum objects, integers, and strings.
     
-    # Handle string (most common from JSON serialization)
-    if isinstance(status, str):
-        return status.upper() in ['SETTLED', 'FAILED']
+    Args:
+        status: Transfer status (enum, int, or str)
     
-    return False
+    Returns:
+        Normalized status string (lowercase)
+    """
+    name = _enum_name(status, _STATUS_NAMES)
+    return name.lower() if name is not None else str(status).lower()
+
+
+def is_terminal_status(status: Any) -> bool:
+    """Check if a transfer status value (enum, int or str) is terminal."""
+    return _enum_name(status, _STATUS_NAMES) in ('SETTLED', 'FAILED')
+
+
+def is_transfer_completed(transfer: Dict[str, Any]) -> bool:
+    """Check if transfer is in terminal state."""
+    return is_terminal_status(transfer.get('status'))
 
 
 def is_transfer_expired(transfer: Dict[str, Any]) -> bool:
@@ -60,24 +108,11 @@ def is_transfer_expired(transfer: Dict[str, Any]) -> bool:
     if not expiration:
         return False
     
-    now = int(time.time())
-    kind = transfer.get('kind')
-    
-    # Handle enum object (if not serialized)
-    if hasattr(kind, 'name'):
-        kind = kind.name
-    # Handle enum value (integer)
-    elif isinstance(kind, int):
-        # TransferKind: RECEIVE_BLIND = 1
-        if kind != 1:
-            return False
-        kind = 'RECEIVE_BLIND'
-    
     # Only RECEIVE_BLIND transfers can expire
-    if isinstance(kind, str) and kind.upper() == 'RECEIVE_BLIND' and expiration < now:
-        return True
+    if _enum_name(transfer.get('kind'), _KIND_NAMES) != 'RECEIVE_BLIND':
+        return False
     
-    return False
+    return expiration < int(time.time())
 
 
 def can_cancel_transfer(transfer: Dict[str, Any]) -> bool:
@@ -97,28 +132,8 @@ def can_cancel_transfer(transfer: Dict[str, Any]) -> bool:
     Returns:
         True if transfer can be cancelled, False otherwise
     """
-    # Check status is WAITING_COUNTERPARTY
-    status = transfer.get('status')
-    
-    # Normalize status to string
-    # TransferStatus enum values: WAITING_COUNTERPARTY=0, WAITING_CONFIRMATIONS=1, SETTLED=2, FAILED=3
-    if hasattr(status, 'name'):
-        status_normalized = status.name.upper()
-    elif isinstance(status, int):
-        # Map integer enum values to names
-        # TransferStatus: WAITING_COUNTERPARTY = 0
-        if status == 0:
-            status_normalized = 'WAITING_COUNTERPARTY'
-        else:
-            status_normalized = str(status).upper()
-    elif isinstance(status, str):
-        status_normalized = status.upper()
-    else:
-        # Try to convert to string and check
-        status_normalized = str(status).upper()
-    
     # Exact match required
-    if status_normalized != 'WAITING_COUNTERPARTY':
+    if _enum_name(transfer.get('status'), _STATUS_NAMES) != 'WAITING_COUNTERPARTY':
         return False
     
     # Check expiration exists and is in the past
@@ -130,23 +145,60 @@ def can_cancel_transfer(transfer: Dict[str, Any]) -> bool:
     if expiration >= now:
         return False
     
-    # Check kind
-    kind = transfer.get('kind')
-    
-    # Normalize kind to string
-    if hasattr(kind, 'name'):
-        kind_name = kind.name.upper()
-    elif isinstance(kind, int):
-        # TransferKind: RECEIVE_BLIND = 1
-        kind_name = 'RECEIVE_BLIND' if kind == 1 else None
-    elif isinstance(kind, str):
-        kind_name = kind.upper()
-    else:
-        kind_name = str(kind).upper() if kind else None
-    
     # Check condition: RECEIVE_BLIND OR expiration + DURATION_RCV_TRANSFER < now
-    is_receive_blind = kind_name == 'RECEIVE_BLIND'
+    is_receive_blind = _enum_name(transfer.get('kind'), _KIND_NAMES) == 'RECEIVE_BLIND'
     expiration_plus_duration = expiration + RGB_INVOICE_DURATION_SECONDS
     
     return is_receive_blind or expiration_plus_duration < now
 
+
+def fail_expired_transfer(
+    credentials: WalletCredentials,
+    transfer: Dict[str, Any],
+    recipient_id: str,
+    log_prefix: str,
+    skip_sync: bool = False
+) -> bool:
+    """
+    Call /wallet/failtransfers for an expired transfer that can be cancelled.
+    
+    Callers are expected to have checked can_cancel_transfer(transfer) first.
+    
+    Args:
+        credentials: Wallet credentials
+        transfer: Transfer dictionary (must carry batch_transfer_idx)
+        recipient_id: Transfer recipient ID (for logging)
+        log_prefix: Log tag of the calling processor (e.g. "UnifiedHandler")
+        skip_sync: If True, skip wallet sync in the failtransfers call
+    
+    Returns:
+        True if the failtransfers call succeeded, False otherwise
+    """
+    wallet_id = format_wallet_id(credentials.xpub_van)
+    batch_transfer_idx = transfer.get('batch_transfer_idx')
+    if batch_transfer_idx is None:
+        logger.warning(
+            f"[{log_prefix}] Wallet {wallet_id} - "
+            f"Transfer {recipient_id} expired but missing batch_transfer_idx"
+        )
+        return False
+    
+    try:
+        result = get_api_client().fail_transfers(
+            job=credentials.to_dict(),
+            batch_transfer_idx=batch_transfer_idx,
+            no_asset_only=False,
+            skip_sync=skip_sync
+        )
+        logger.info(
+            f"[{log_prefix}] Wallet {wallet_id} - "
+            f"Failed expired transfer {recipient_id} (batch_transfer_idx={batch_transfer_idx}): {result}"
+        )
+        return True
+    except Exception as e:
+        logger.error(
+            f"[{log_prefix}] Wallet {wallet_id} - "
+            f"Failed to call failtransfers for expired transfer {recipient_id}: {e}",
+            exc_info=True
+        )
+        return False
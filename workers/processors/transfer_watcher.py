@@ -6,11 +6,24 @@ Refactored into classes for better structure and maintainability.
 """
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
-from workers.config import REFRESH_INTERVAL, WALLET_LOCK_TTL
+from workers.config import (
+    REFRESH_INTERVAL,
+    WALLET_LOCK_TTL,
+    ASSET_FETCH_CONCURRENCY,
+    WATCHER_INITIAL_POLL_INTERVAL,
+)
 from workers.api.client import get_api_client
-from workers.processors.transfer_utils import is_transfer_completed, is_transfer_expired, can_cancel_transfer
-from workers.utils import format_wallet_id, normalize_transfer_status
+from workers.processors.transfer_utils import (
+    is_transfer_completed,
+    is_transfer_expired,
+    is_terminal_status,
+    normalize_transfer_status,
+    can_cancel_transfer,
+    fail_expired_transfer,
+)
+from workers.utils import format_wallet_id
 from workers.models import WalletCredentials, Watcher
 from src.queue import (
     create_watcher,
@@ -25,6 +38,9 @@ from src.queue import (
 
 logger = logging.getLogger(__name__)
 
+# Growth factor for the watcher poll delay between cycles
+WATCHER_POLL_BACKOFF = 1.5
+
 
 class WatcherLifecycle:
     """Manages watcher lifecycle (creation, updates, stopping)."""
@@ -103,6 +119,12 @@ class TransferMonitor:
         self.asset_id = asset_id
         self.wallet_id = format_wallet_id(credentials.xpub_van)
         self.api_client = get_api_client()
+        
+        # Built once; the API client only reads it on every poll
+        self.job_dict = credentials.to_dict()
+        self.job_dict['recipient_id'] = recipient_id
+        if asset_id:
+            self.job_dict['asset_id'] = asset_id
     
     def get_transfer_status(self) -> Optional[dict]:
         """
@@ -111,12 +133,7 @@ class TransferMonitor:
         Returns:
             Transfer dictionary or None if not found
         """
-        job_dict = self.credentials.to_dict()
-        job_dict['recipient_id'] = self.recipient_id
-        if self.asset_id:
-            job_dict['asset_id'] = self.asset_id
-        
-        return self.api_client.get_transfer_status(job_dict)
+        return self.api_client.get_transfer_status(self.job_dict)
     
     def check_completion(self, transfer: dict) -> Optional[str]:
         """
@@ -153,33 +170,31 @@ class TransferMonitor:
         This is used when a transfer was created without asset_id but may have
         been assigned an asset_id after refresh.
         
+        Only called right after get_transfer_status() missed the transfer in the
+        listing without asset_id, so that listing is not fetched again here.
+        Per-asset listings are fetched in parallel; the first match in asset
+        order wins.
+        
         Returns:
             Tuple of (transfer_dict, asset_id) if found, None otherwise
-            Note: asset_id can be None if transfer is found in list_transfers without asset_id
         """
         try:
             job_dict = self.credentials.to_dict()
-            
-            # First, try listing transfers without asset_id
-            transfers = self.api_client.list_transfers(job_dict, asset_id=None)
-            for transfer in transfers:
-                if transfer.get('recipient_id') == self.recipient_id:
-                    # Found in transfers without asset_id, return with asset_id=None
-                    return (transfer, None)
-            
-            # If not found, search through all assets
             assets = self.api_client.list_assets(job_dict)
-            for asset in assets:
-                asset_id = asset.get('asset_id')
-                if not asset_id:
-                    continue
+            asset_ids = [str(asset['asset_id']) for asset in assets if asset.get('asset_id')]
+            
+            with ThreadPoolExecutor(max_workers=ASSET_FETCH_CONCURRENCY) as executor:
+                transfer_futures = [
+                    executor.submit(self.api_client.list_transfers, job_dict, asset_id_str, self.recipient_id)
+                    for asset_id_str in asset_ids
+                ]
                 
-                asset_id_str = str(asset_id)
-                asset_transfers = self.api_client.list_transfers(job_dict, asset_id_str)
-                for transfer in asset_transfers:
-                    if transfer.get('recipient_id') == self.recipient_id:
-                        # Found in this asset, return with the asset_id
-                        return (transfer, asset_id_str)
+                for asset_id_str, transfers_future in zip(asset_ids, transfer_futures):
+                    for transfer in transfers_future.result():
+                        if transfer.get('recipient_id') == self.recipient_id:
+                            # Found in this asset; drop listings not yet started
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            return (transfer, asset_id_str)
             
             return None
         except Exception as e:
@@ -329,6 +344,9 @@ def watch_transfer(
     )
     
     refresh_count = 0
+    # Fresh transfers change state soonest, so poll quickly at first and back
+    # off towards REFRESH_INTERVAL
+    poll_interval = min(WATCHER_INITIAL_POLL_INTERVAL, REFRESH_INTERVAL)
     
     try:
         while not shutdown_flag():
@@ -348,28 +366,23 @@ def watch_transfer(
                             transfer, found_asset_id = result
                             found_expiration = transfer.get('expiration')
                             
-                            if found_asset_id:
-                                logger.info(
-                                    f"[TransferWatcher] Wallet {wallet_id} - "
-                                    f"Found transfer {recipient_id} with asset_id={found_asset_id}, "
-                                    f"updating watcher..."
-                                )
-                                
-                                update_watcher_asset_and_expiration(
-                                    credentials.xpub_van,
-                                    recipient_id,
-                                    found_asset_id,
-                                    found_expiration
-                                )
-                                
-                                monitor.asset_id = found_asset_id
-                                lifecycle.asset_id = found_asset_id
-                                asset_id = found_asset_id
-                            else:
-                                logger.info(
-                                    f"[TransferWatcher] Wallet {wallet_id} - "
-                                    f"Found transfer {recipient_id} but still without asset_id"
-                                )
+                            logger.info(
+                                f"[TransferWatcher] Wallet {wallet_id} - "
+                                f"Found transfer {recipient_id} with asset_id={found_asset_id}, "
+                                f"updating watcher..."
+                            )
+                            
+                            update_watcher_asset_and_expiration(
+                                credentials.xpub_van,
+                                recipient_id,
+                                found_asset_id,
+                                found_expiration
+                            )
+                            
+                            monitor.asset_id = found_asset_id
+                            monitor.job_dict['asset_id'] = found_asset_id
+                            lifecycle.asset_id = found_asset_id
+                            asset_id = found_asset_id
                         else:
                             logger.info(
                                 f"[TransferWatcher] Wallet {wallet_id} - "
@@ -401,32 +414,7 @@ def watch_transfer(
                         )
                         
                         if can_cancel_transfer(transfer):
-                            batch_transfer_idx = transfer.get('batch_transfer_idx')
-                            if batch_transfer_idx is not None:
-                                try:
-                                    api_client = get_api_client()
-                                    job_dict = credentials.to_dict()
-                                    result = api_client.fail_transfers(
-                                        job=job_dict,
-                                        batch_transfer_idx=batch_transfer_idx,
-                                        no_asset_only=False,
-                                        skip_sync=False
-                                    )
-                                    logger.info(
-                                        f"[TransferWatcher] Wallet {wallet_id} - "
-                                        f"Failed expired transfer {recipient_id} (batch_transfer_idx={batch_transfer_idx}): {result}"
-                                    )
-                                except Exception as e:
-                                    logger.error(
-                                        f"[TransferWatcher] Wallet {wallet_id} - "
-                                        f"Failed to call failtransfers for expired transfer {recipient_id}: {e}",
-                                        exc_info=True
-                                    )
-                            else:
-                                logger.warning(
-                                    f"[TransferWatcher] Wallet {wallet_id} - "
-                                    f"Transfer {recipient_id} expired but missing batch_transfer_idx"
-                                )
+                            fail_expired_transfer(credentials, transfer, recipient_id, "TransferWatcher")
                         else:
                             logger.info(
                                 f"[TransferWatcher] Wallet {wallet_id} - "
@@ -467,10 +455,24 @@ def watch_transfer(
                                         f"Stopped watching transfer {recipient_id} - refresh failure detected"
                                     )
                                     return
+                                
+                                # The refresh already reports the new status; no need to
+                                # wait a cycle and list transfers again to see it
+                                updated_status = transfer_result.get('updated_status')
+                                if is_terminal_status(updated_status):
+                                    final_status = normalize_transfer_status(updated_status)
+                                    lifecycle.update_status(final_status, refresh_count)
+                                    lifecycle.stop()
+                                    logger.info(
+                                        f"[TransferWatcher] Wallet {wallet_id} - "
+                                        f"Stopped watching transfer {recipient_id} - status: {final_status} (from refresh)"
+                                    )
+                                    return
                     
                     lifecycle.update_status("watching", refresh_count)
                 
-                time.sleep(REFRESH_INTERVAL)
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * WATCHER_POLL_BACKOFF, REFRESH_INTERVAL)
                 
             except Exception as e:
                 logger.error(
@@ -4,14 +4,17 @@ Unified wallet handler.
 Processes all assets and transfers for a wallet, creating watchers for incomplete transfers.
 """
 import logging
-from typing import Dict, Any, List, Optional
-from workers.config import MAX_RETRIES, RETRY_DELAY_BASE
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Union
+from workers.config import MAX_RETRIES, RETRY_DELAY_BASE, ASSET_FETCH_CONCURRENCY
 from workers.api.client import get_api_client
 from workers.processors.transfer_utils import (
     is_transfer_completed,
     is_transfer_expired,
     get_transfer_identifier,
     can_cancel_transfer,
+    fail_expired_transfer,
 )
 from workers.utils import retry_with_backoff, format_wallet_id
 from workers.models import WalletCredentials, Job
@@ -19,7 +22,7 @@ from src.queue import (
     acquire_wallet_lock,
     release_wallet_lock,
     create_watcher,
-    get_watcher_status,
+    get_watcher_recipient_ids,
 )
 
 logger = logging.getLogger(__name__)
@@ -85,14 +88,14 @@ def _refresh_wallet_with_retry(
                 f"[UnifiedHandler] Wallet {wallet_id} - Refresh failed, "
                 f"retrying in {delay}s: {e}"
             )
-            import time
             time.sleep(delay)
 
 
 def _create_watcher_for_transfer(
     credentials: WalletCredentials,
     recipient_id: str,
-    asset_id: Optional[str]
+    asset_id: Optional[str],
+    existing_watchers: Set[str]
 ) -> None:
     """
     Create watcher entry for a transfer if it doesn't exist.
@@ -101,11 +104,11 @@ def _create_watcher_for_transfer(
         credentials: Wallet credentials
         recipient_id: Transfer recipient ID
         asset_id: Optional asset ID
+        existing_watchers: Recipient IDs that already have a watcher (updated in-place)
     """
     wallet_id = format_wallet_id(credentials.xpub_van)
-    existing_watcher = get_watcher_status(credentials.xpub_van, recipient_id)
     
-    if existing_watcher:
+    if recipient_id in existing_watchers:
         logger.debug(
             f"[UnifiedHandler] Wallet {wallet_id} - "
             f"Watcher already exists for transfer {recipient_id}"
@@ -120,6 +123,7 @@ def _create_watcher_for_transfer(
             recipient_id=recipient_id,
             asset_id=asset_id
         )
+        existing_watchers.add(recipient_id)
         logger.info(
             f"[UnifiedHandler] Wallet {wallet_id} - "
             f"Created watcher entry for transfer {recipient_id}"
@@ -135,6 +139,7 @@ def _process_transfers_for_asset(
     credentials: WalletCredentials,
     asset_id: Optional[str],
     transfers: List[Dict[str, Any]],
+    existing_watchers: Set[str],
     shutdown_flag: callable
 ) -> None:
     """
@@ -144,6 +149,7 @@ def _process_transfers_for_asset(
         credentials: Wallet credentials
         asset_id: Asset ID (None for transfers without asset_id)
         transfers: List of transfer dictionaries
+        existing_watchers: Recipient IDs that already have a watcher
         shutdown_flag: Callable that returns True if shutdown requested
     """
     wallet_id = format_wallet_id(credentials.xpub_van)
@@ -162,35 +168,11 @@ def _process_transfers_for_asset(
             continue
         
         if _should_watch_transfer(transfer):
-            _create_watcher_for_transfer(credentials, recipient_id, asset_id)
+            _create_watcher_for_transfer(credentials, recipient_id, asset_id, existing_watchers)
         elif is_transfer_expired(transfer):
             if can_cancel_transfer(transfer):
-                batch_transfer_idx = transfer.get('batch_transfer_idx')
-                if batch_transfer_idx is not None:
-                    try:
-                        api_client = get_api_client()
-                        job_dict = credentials.to_dict()
-                        result = api_client.fail_transfers(
-                            job=job_dict,
-                            batch_transfer_idx=batch_transfer_idx,
-                            no_asset_only=False,
-                            skip_sync=False
-                        )
-                        logger.info(
-                            f"[UnifiedHandler] Wallet {wallet_id} - "
-                            f"Failed expired transfer {recipient_id} (batch_transfer_idx={batch_transfer_idx}): {result}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"[UnifiedHandler] Wallet {wallet_id} - "
-                            f"Failed to call failtransfers for expired transfer {recipient_id}: {e}",
-                            exc_info=True
-                        )
-                else:
-                    logger.warning(
-                        f"[UnifiedHandler] Wallet {wallet_id} - "
-                        f"Transfer {recipient_id} expired but missing batch_transfer_idx"
-                    )
+                # The wallet was refreshed (and synced) at the start of this job
+                fail_expired_transfer(credentials, transfer, recipient_id, "UnifiedHandler", skip_sync=True)
             else:
                 logger.debug(
                     f"[UnifiedHandler] Wallet {wallet_id} - "
@@ -211,7 +193,8 @@ def _process_assets_and_transfers(
     Process all assets and their transfers, creating watchers for incomplete transfers.
     
     First processes transfers without asset_id (invoices created without asset_id),
-    then processes all assets and their transfers.
+    then processes all assets and their transfers. The transfer and asset
+    listings, and then the per-asset transfer listings, are fetched concurrently.
     
     Args:
         credentials: Wallet credentials
@@ -221,21 +204,28 @@ def _process_assets_and_transfers(
     job_dict = credentials.to_dict()
     wallet_id = format_wallet_id(credentials.xpub_van)
     
-    logger.info(f"[UnifiedHandler] Wallet {wallet_id} - Listing transfers without asset_id...")
-    transfers_without_asset = api_client.list_transfers(job_dict, asset_id=None)
-    logger.info(f"[UnifiedHandler] Wallet {wallet_id} - Found {len(transfers_without_asset)} transfer(s) without asset_id")
-    
-    if transfers_without_asset:
-        _process_transfers_for_asset(credentials, None, transfers_without_asset, shutdown_flag)
+    # One query for every watcher this wallet already has, instead of one per transfer
+    existing_watchers = get_watcher_recipient_ids(credentials.xpub_van)
     
-    logger.info(f"[UnifiedHandler] Wallet {wallet_id} - Listing assets...")
-    assets = api_client.list_assets(job_dict)
+    # Both listings are independent API round-trips, so issue them concurrently
+    logger.info(f"[UnifiedHandler] Wallet {wallet_id} - Listing transfers without asset_id and assets...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        transfers_future = executor.submit(api_client.list_transfers, job_dict, None)
+        assets_future = executor.submit(api_client.list_assets, job_dict)
+        
+        transfers_without_asset = transfers_future.result()
+        logger.info(f"[UnifiedHandler] Wallet {wallet_id} - Found {len(transfers_without_asset)} transfer(s) without asset_id")
+        
+        if transfers_without_asset:
+            _process_transfers_for_asset(
+                credentials, None, transfers_without_asset, existing_watchers, shutdown_flag
+            )
+        
+        assets = assets_future.result()
     logger.info(f"[UnifiedHandler] Wallet {wallet_id} - Found {len(assets)} asset(s)")
     
+    asset_ids = []
     for asset in assets:
-        if shutdown_flag():
-            break
-        
         asset_id = asset.get('asset_id')
         if not asset_id:
             logger.warning(
@@ -243,20 +233,30 @@ def _process_assets_and_transfers(
                 f"Asset missing asset_id: {asset}"
             )
             continue
+        asset_ids.append(str(asset_id))
+    
+    # Per-asset listings are independent reads: fetch them in parallel,
+    # then process the results sequentially in asset order
+    with ThreadPoolExecutor(max_workers=ASSET_FETCH_CONCURRENCY) as executor:
+        transfer_futures = [
+            executor.submit(api_client.list_transfers, job_dict, asset_id_str)
+            for asset_id_str in asset_ids
+        ]
         
-        asset_id_str = str(asset_id)
-        logger.debug(
-            f"[UnifiedHandler] Wallet {wallet_id} - "
-            f"Listing transfers for asset {asset_id_str}"
-        )
-        
-        transfers = api_client.list_transfers(job_dict, asset_id_str)
-        logger.debug(
-            f"[UnifiedHandler] Wallet {wallet_id} - "
-            f"Found {len(transfers)} transfer(s) for asset {asset_id_str}"
-        )
-        
-        _process_transfers_for_asset(credentials, asset_id_str, transfers, shutdown_flag)
+        for asset_id_str, transfers_future in zip(asset_ids, transfer_futures):
+            if shutdown_flag():
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+            
+            transfers = transfers_future.result()
+            logger.debug(
+                f"[UnifiedHandler] Wallet {wallet_id} - "
+                f"Found {len(transfers)} transfer(s) for asset {asset_id_str}"
+            )
+            
+            _process_transfers_for_asset(
+                credentials, asset_id_str, transfers, existing_watchers, shutdown_flag
+            )
     
     logger.info(
         f"[UnifiedHandler] Wallet {wallet_id} - "
@@ -264,7 +264,7 @@ def _process_assets_and_transfers(
     )
 
 
-def process_wallet_unified(job: Dict[str, Any], shutdown_flag: callable) -> None:
+def process_wallet_unified(job: Union[Dict[str, Any], Job], shutdown_flag: callable) -> None:
     """
     Unified wallet processing handler.
     
@@ -275,10 +275,10 @@ def process_wallet_unified(job: Dict[str, Any], shutdown_flag: callable) -> None
     4. Creating watchers for incomplete transfers (if they don't exist)
     
     Args:
-        job: Job dictionary with wallet credentials
+        job: Job (or job dictionary) with wallet credentials
         shutdown_flag: Callable that returns True if shutdown requested
     """
-    job_obj = Job.from_dict(job)
+    job_obj = job if isinstance(job, Job) else Job.from_dict(job)
     credentials = job_obj.get_credentials()
     max_retries = job_obj.max_retries
     
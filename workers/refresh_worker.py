@@ -25,6 +25,7 @@ from workers.signals import register_signal_handlers, get_shutdown_flag
 from workers.api.client import get_api_client
 from workers.utils import format_wallet_id
 from src.database.connection import get_db_connection
+from src.queue.recovery import recover_active_watchers
 from psycopg2.extras import RealDictCursor
 
 # Configure logging
@@ -82,18 +83,18 @@ def cleanup_dead_processes() -> None:
     """Remove dead processes from active_processes dictionary."""
     global active_processes
     
-    dead_wallets = []
-    for xpub_van, process in active_processes.items():
-        if process.poll() is not None:
-            dead_wallets.append(xpub_van)
-            wallet_id = format_wallet_id(xpub_van)
-            logger.debug(
-                f"[RefreshWorker] Wallet worker for {wallet_id} "
-                f"terminated (exit code: {process.returncode})"
-            )
+    dead_wallets = [
+        xpub_van for xpub_van, process in active_processes.items()
+        if process.poll() is not None
+    ]
     
     for xpub_van in dead_wallets:
-        active_processes.pop(xpub_van, None)
+        process = active_processes.pop(xpub_van)
+        wallet_id = format_wallet_id(xpub_van)
+        logger.debug(
+            f"[RefreshWorker] Wallet worker for {wallet_id} "
+            f"terminated (exit code: {process.returncode})"
+        )
 
 
 def terminate_all_processes() -> None:
@@ -119,10 +120,9 @@ def terminate_all_processes() -> None:
             logger.error(f"Error terminating process for {wallet_id}: {e}")
     
     # Wait for processes to terminate (with timeout)
-    timeout = 10
-    start_time = time.time()
+    deadline = time.monotonic() + 10
     
-    while active_processes and (time.time() - start_time) < timeout:
+    while active_processes and time.monotonic() < deadline:
         cleanup_dead_processes()
         if active_processes:
             time.sleep(0.5)
@@ -167,22 +167,21 @@ def main() -> None:
     
     # Recover active watchers on startup (create pending jobs for wallets with active watchers)
     try:
-        from src.queue.recovery import recover_active_watchers
         logger.info("Recovering active watchers on startup...")
         recovered = recover_active_watchers()
         logger.info(f"Recovery complete: {recovered} watchers recovered")
     except Exception as e:
         logger.error(f"Failed to recover active watchers on startup: {e}", exc_info=True)
     
-    last_heartbeat = time.time()
+    last_heartbeat = time.monotonic()
     heartbeat_interval = 30
-    last_cleanup = time.time()
+    last_cleanup = time.monotonic()
     cleanup_interval = 10  # Clean up dead processes every 10 seconds
     
     try:
         while not get_shutdown_flag():
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 if current_time - last_cleanup >= cleanup_interval:
                     cleanup_dead_processes()
                     last_cleanup = current_time
@@ -190,25 +189,23 @@ def main() -> None:
                 try:
                     with get_db_connection() as conn:
                         with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                            # Wallets with pending jobs or active watchers, in one round-trip
+                            # (UNION already removes duplicates)
                             cur.execute("""
-                                SELECT DISTINCT xpub_van
+                                SELECT xpub_van
                                 FROM refresh_jobs
                                 WHERE status = 'pending'
-                            """)
-                            
-                            wallets_with_pending_jobs = [row['xpub_van'] for row in cur.fetchall()]
-                            
-                            cur.execute("""
-                                SELECT DISTINCT xpub_van
+                                UNION
+                                SELECT xpub_van
                                 FROM refresh_watchers
                                 WHERE status = 'watching'
                                 AND (expires_at IS NULL OR expires_at > NOW())
                             """)
                             
-                            wallets_with_active_watchers = [row['xpub_van'] for row in cur.fetchall()]
+                            wallets_needing_processing = [row['xpub_van'] for row in cur.fetchall()]
                             
-                            # Combine both sets (wallets that need processing)
-                            wallets_needing_processing = set(wallets_with_pending_jobs) | set(wallets_with_active_watchers)
+                            # Count live workers once per poll and keep it current as we spawn
+                            running_count = sum(1 for p in active_processes.values() if p.poll() is None)
                             
                             for xpub_van in wallets_needing_processing:
                                 if xpub_van in active_processes:
@@ -222,8 +219,6 @@ def main() -> None:
                                         )
                                         active_processes.pop(xpub_van, None)
                                 
-                                running_count = len([p for p in active_processes.values() if p.poll() is None])
-                                
                                 if running_count >= MAX_WALLET_PROCESSES:
                                     wallet_id = format_wallet_id(xpub_van)
                                     logger.warning(
@@ -235,7 +230,7 @@ def main() -> None:
                                 process = spawn_wallet_worker(xpub_van)
                                 if process:
                                     active_processes[xpub_van] = process
-                                    running_count = len([p for p in active_processes.values() if p.poll() is None])
+                                    running_count += 1
                                     wallet_id = format_wallet_id(xpub_van)
                                     logger.info(
                                         f"[RefreshWorker] Wallet worker spawned for wallet {wallet_id} "
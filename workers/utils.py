@@ -77,25 +77,3 @@ def format_wallet_id(xpub_van: str, length: int = 5) -> str:
     if len(xpub_van) <= length * 2:
         return xpub_van
     return f"{xpub_van[:length]}...{xpub_van[-length:]}"
-
-
-def normalize_transfer_status(status: Any) -> str:
-    """
-    Normalize transfer status to string.
-    
-    Handles enum objects, integers, and strings.
-    
-    Args:
-        status: Transfer status (enum, int, or str)
-    
-    Returns:
-        Normalized status string (lowercase)
-    """
-    if hasattr(status, 'name'):
-        return status.name.lower()
-    elif isinstance(status, int):
-        # TransferStatus: SETTLED=2, FAILED=3
-        return 'settled' if status == 2 else 'failed'
-    else:
-        return str(status).lower()
-
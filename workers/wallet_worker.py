@@ -122,7 +122,7 @@ def main() -> None:
     # Register signal handlers
     register_signal_handlers()
     
-    last_work_time = time.time()
+    last_work_time = time.monotonic()
     
     try:
         while not get_shutdown_flag():
@@ -137,7 +137,7 @@ def main() -> None:
                     break
                 
                 has_work = True
-                last_work_time = time.time()
+                last_work_time = time.monotonic()
                 
                 job_id = job.get('job_id', 'unknown')
                 logger.info(
@@ -161,10 +161,10 @@ def main() -> None:
                 processed = process_watchers_for_wallet(xpub_van)
                 if processed > 0:
                     has_work = True
-                    last_work_time = time.time()
+                    last_work_time = time.monotonic()
             
             if not has_work:
-                idle_time = time.time() - last_work_time
+                idle_time = time.monotonic() - last_work_time
                 if idle_time >= WALLET_WORKER_IDLE_TIMEOUT:
                     logger.info(
                         f"[WalletWorker] Wallet {wallet_id} - "